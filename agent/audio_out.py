@@ -0,0 +1,107 @@
+# agent/audio_out.py
+import asyncio
+import logging
+from typing import List, Optional
+
+import numpy as np
+from livekit import rtc
+
+logger = logging.getLogger("procrastihator")
+
+
+class BatchedAudioPusher:
+    """
+    TTS가 내보내는 작은 오디오 청크(20ms 이하)를 모아서 큰 프레임으로 AudioSource에 송출합니다.
+    - capture_frame await 횟수(이벤트 루프 왕복)를 줄이기 위해 기본 100ms 단위로 합침
+    - 첫 프레임은 20ms만 모아서 바로 보냄 (첫 소리까지의 지연 유지)
+    - 송출은 별도 태스크가 담당하고, 사이에 크기 제한 Queue를 둬서 TTS 수신 루프가 capture_frame에 묶이지 않음
+
+    사용법:
+        async with BatchedAudioPusher(audio_source) as pusher:
+            async for audio in tts_stream:
+                await pusher.push(audio.frame)
+    """
+
+    def __init__(self, audio_source: rtc.AudioSource, first_ms: int = 20, batch_ms: int = 100,
+                 max_queue: int = 8, frames_out: Optional[List[rtc.AudioFrame]] = None):
+        """
+        :param first_ms: 첫 프레임 크기 (ms)
+        :param batch_ms: 이후 프레임 크기 (ms)
+        :param max_queue: 송출 대기 프레임 최대 개수 (가득 차면 push가 대기)
+        :param frames_out: 주어지면 송출한(합쳐진) 프레임을 여기에 모음 (응답 캐시용)
+        """
+        self.audio_source = audio_source
+        self.first_ms = first_ms
+        self.batch_ms = batch_ms
+        self.frames_out = frames_out
+        self._queue: "asyncio.Queue[Optional[rtc.AudioFrame]]" = asyncio.Queue(maxsize=max_queue)
+        self._task: Optional[asyncio.Task] = None
+
+        # 누적 버퍼 (첫 청크의 포맷을 보고 생성)
+        self._buf: Optional[np.ndarray] = None
+        self._filled = 0
+        self._target = 0
+        self._sample_rate = 0
+        self._num_channels = 0
+
+    async def __aenter__(self):
+        self._task = asyncio.create_task(self._pump())
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            await self.aclose()
+        else:
+            # 오류/취소 시에는 남은 프레임을 버리고 송출 태스크를 정리 (끝날 때까지 대기)
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    async def push(self, frame: rtc.AudioFrame):
+        """청크를 누적하고, 목표 크기가 차면 송출 Queue로 넘김"""
+        if frame.sample_rate != self._sample_rate or frame.num_channels != self._num_channels:
+            # 포맷이 바뀌면 (또는 첫 청크면) 남은 데이터를 보내고 버퍼 재생성
+            await self._flush()
+            self._sample_rate = frame.sample_rate
+            self._num_channels = frame.num_channels
+            batch_len = self._sample_rate * self.batch_ms // 1000 * self._num_channels
+            self._buf = np.empty(batch_len, dtype=np.int16)
+            self._target = self._sample_rate * self.first_ms // 1000 * self._num_channels
+
+        samples = np.frombuffer(frame.data, dtype=np.int16)
+        while samples.size:
+            n = min(samples.size, self._target - self._filled)
+            self._buf[self._filled:self._filled + n] = samples[:n]
+            self._filled += n
+            samples = samples[n:]
+            if self._filled >= self._target:
+                await self._flush()
+                self._target = self._buf.size
+
+    async def aclose(self):
+        """남은 데이터를 보내고 송출이 끝날 때까지 대기"""
+        await self._flush()
+        await self._queue.put(None)
+        await self._task
+
+    async def _flush(self):
+        if not self._filled:
+            return
+        data = self._buf[:self._filled].tobytes()
+        frame = rtc.AudioFrame(data, self._sample_rate, self._num_channels, self._filled // self._num_channels)
+        self._filled = 0
+        if self.frames_out is not None:
+            self.frames_out.append(frame)
+        await self._queue.put(frame)
+
+    async def _pump(self):
+        while True:
+            frame = await self._queue.get()
+            if frame is None:
+                return
+            try:
+                await self.audio_source.capture_frame(frame)
+            except Exception as e:
+                logger.error(f"Audio Capture Error: {e}")
@@ -0,0 +1,66 @@
+# agent/cache.py
+import hashlib
+import time
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
+from livekit import rtc
+
+
+# 감지 때마다 값이 달라지는 측정치 (키에 넣으면 같은 상황이어도 절대 히트하지 않음)
+VOLATILE_DATA_KEYS = frozenset({"duration", "ear", "confidence"})
+
+
+class AgentResponseCache:
+    """
+    (성격, 이벤트, 상세, 기억 상태) 가 완전히 같은 요청에 대한 잔소리 결과 캐시.
+    히트 시 LLM과 TTS를 모두 건너뛰고 저장된 오디오 프레임을 그대로 재생합니다.
+    """
+
+    def __init__(self, ttl_seconds: float = 300.0, max_entries: int = 32):
+        """
+        :param ttl_seconds: 캐시 유지 시간 (기본값: 5분)
+        :param max_entries: 최대 저장 개수 (초과 시 가장 오래 안 쓰인 항목부터 제거)
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, str, List[rtc.AudioFrame]]]" = OrderedDict()
+
+    @staticmethod
+    def make_key(persona: str, event: str, data, memory_state: str) -> str:
+        """
+        :param data: 이벤트 상세. dict면 VOLATILE_DATA_KEYS를 제외한 항목만 키에 반영
+        :param memory_state: 반복되는 기억 상태 (타임스탬프가 들어간 값을 넣으면 캐시가 히트하지 않음)
+        """
+        if isinstance(data, dict):
+            data = sorted((k, repr(v)) for k, v in data.items() if k not in VOLATILE_DATA_KEYS)
+        raw = f"{persona}|{event}|{data}|{memory_state}"
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Tuple[str, List[rtc.AudioFrame]]]:
+        """(text, frames) 반환. 없거나 만료되었으면 None"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        stored_at, text, frames = entry
+        if time.monotonic() - stored_at > self.ttl_seconds:
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return text, frames
+
+    def put(self, key: str, text: str, frames: List[rtc.AudioFrame]):
+        # 오디오가 없는 결과(TTS 실패 등)는 저장하지 않음
+        if not frames:
+            return
+
+        self._entries[key] = (time.monotonic(), text, frames)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        """캐시 초기화 (목소리 변경 등 저장된 오디오가 무효해질 때)"""
+        self._entries.clear()
@@ -1,51 +1,78 @@
 import os
+import threading
+from typing import AsyncIterator, Optional
 from google import genai
 from google.genai import types
 
+FALLBACK_LINE = "야! 시스템 오류났어! 빨리 안 고쳐?"
+
+# 잔소리는 최대 3문장이므로 출력 길이 상한을 둬서 지연 시간 제한
+MAX_OUTPUT_TOKENS = 256
+
+# 안전 설정 (잔소리가 필터링되지 않도록 임계값을 모두 해제/낮춤) - 상수이므로 모듈에서 한 번만 생성
+_SAFETY_SETTINGS = [
+    types.SafetySetting(
+        category="HARM_CATEGORY_HARASSMENT",
+        threshold="BLOCK_NONE",
+    ),
+    types.SafetySetting(
+        category="HARM_CATEGORY_HATE_SPEECH",
+        threshold="BLOCK_NONE",
+    ),
+    types.SafetySetting(
+        category="HARM_CATEGORY_SEXUALLY_EXPLICIT",
+        threshold="BLOCK_NONE",
+    ),
+    types.SafetySetting(
+        category="HARM_CATEGORY_DANGEROUS_CONTENT",
+        threshold="BLOCK_NONE",
+    ),
+]
+
+# 프로세스 전역 Gemini 클라이언트 (세션마다 새로 만들면 TLS/인증 셋업 비용이 반복됨)
+_genai_client: Optional[genai.Client] = None
+_client_lock = threading.Lock()
+
+def _get_client() -> genai.Client:
+    global _genai_client
+    if _genai_client is None:
+        with _client_lock:
+            if _genai_client is None:
+                # API 키 설정
+                api_key = os.getenv("GOOGLE_API_KEY")
+                if not api_key:
+                    # 로컬 개발 편의를 위해 일단 경고만 하거나 에러를 발생시킴
+                    print("Error: GOOGLE_API_KEY environment variable not found.")
+                
+                # 클라이언트 초기화 (새로운 SDK 방식)
+                _genai_client = genai.Client(api_key=api_key)
+    return _genai_client
+
 class LLMHandler:
     def __init__(self):
-        # API 키 설정
-        api_key = os.getenv("GOOGLE_API_KEY")
-        if not api_key:
-            # 로컬 개발 편의를 위해 일단 경고만 하거나 에러를 발생시킴
-            print("Error: GOOGLE_API_KEY environment variable not found.")
-        
-        # 클라이언트 초기화 (새로운 SDK 방식)
-        self.client = genai.Client(api_key=api_key)
-        
-        # 안전 설정 (잔소리가 필터링되지 않도록 임계값을 모두 해제/낮춤)
-        self.safety_settings = [
-            types.SafetySetting(
-                category="HARM_CATEGORY_HARASSMENT",
-                threshold="BLOCK_NONE",
-            ),
-            types.SafetySetting(
-                category="HARM_CATEGORY_HATE_SPEECH",
-                threshold="BLOCK_NONE",
-            ),
-            types.SafetySetting(
-                category="HARM_CATEGORY_SEXUALLY_EXPLICIT",
-                threshold="BLOCK_NONE",
-            ),
-            types.SafetySetting(
-                category="HARM_CATEGORY_DANGEROUS_CONTENT",
-                threshold="BLOCK_NONE",
-            ),
-        ]
+        self.client = _get_client()
+        self.safety_settings = _SAFETY_SETTINGS
+
+    def _make_config(self, system_prompt: str) -> types.GenerateContentConfig:
+        return types.GenerateContentConfig(
+            system_instruction=system_prompt,
+            safety_settings=self.safety_settings,
+            max_output_tokens=MAX_OUTPUT_TOKENS,
+            candidate_count=1
+        )
 
     async def get_scolding(self, system_prompt: str, user_context: str) -> str:
         """
         시스템 프롬프트와 사용자 상황 데이터를 받아 Gemini의 매운맛 반응을 반환합니다.
+        system_prompt는 system_instruction으로 분리해서 보내므로, 호출 간 바이트 단위로 동일하게 유지해야
+        Gemini implicit prompt caching이 적용됩니다. 변하는 데이터는 user_context에만 넣으세요.
         """
         try:
             # 비동기 호출 (새로운 SDK 방식)
             response = await self.client.aio.models.generate_content(
                 model="gemini-2.5-flash-lite",
                 contents=user_context,
-                config=types.GenerateContentConfig(
-                    system_instruction=system_prompt,
-                    safety_settings=self.safety_settings
-                )
+                config=self._make_config(system_prompt)
             )
             
             return response.text
@@ -53,4 +80,27 @@ class LLMHandler:
         except Exception as e:
             print(f"Gemini API Error: {e}")
             # 에러 발생 시 기본 대사 반환 (Fail-safe)
-            return "야! 시스템 오류났어! 빨리 안 고쳐?"
+            return FALLBACK_LINE
+
+    async def stream_scolding(self, system_prompt: str, user_context: str) -> AsyncIterator[str]:
+        """
+        get_scolding의 스트리밍 버전. 생성되는 텍스트 조각을 도착하는 대로 yield 합니다.
+        (전체 생성을 기다리지 않고 TTS에 바로 흘려보내기 위함)
+        """
+        yielded = False
+        try:
+            stream = await self.client.aio.models.generate_content_stream(
+                model="gemini-2.5-flash-lite",
+                contents=user_context,
+                config=self._make_config(system_prompt)
+            )
+            async for chunk in stream:
+                if chunk.text:
+                    yielded = True
+                    yield chunk.text
+
+        except Exception as e:
+            print(f"Gemini API Error: {e}")
+            # 아무것도 못 보냈을 때만 기본 대사 반환 (Fail-safe)
+            if not yielded:
+                yield FALLBACK_LINE
@@ -2,6 +2,9 @@
 import asyncio
 import logging
 import sys, os
+import time
+from collections import deque
+from typing import Optional
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -16,17 +19,59 @@ from shared.protocol import Packet, PacketMeta
 from shared.constants import SystemEvents, ScreenEvents, VisionEvents, PacketCategory
 from agent.memory import AgentMemory
 from agent.prompts import SYSTEM_PROMPT
-from agent.llm import LLMHandler
+from agent.llm import LLMHandler, FALLBACK_LINE
+from agent.cache import AgentResponseCache
+from agent.tts_cache import CachedTTS
+from agent.audio_out import BatchedAudioPusher
 
 logger = logging.getLogger("procrastihator")
 
+# uvloop이 설치되어 있으면 이벤트 루프로 사용 (Windows 미지원 -> 기본 루프 유지)
+# livekit-agents는 entrypoint를 별도 job 프로세스에서 실행하고, 그 프로세스는 __main__ 블록을 실행하지 않고
+# 이 모듈을 import만 하므로, 정책을 import 시점에 설정해야 job 프로세스의 루프에도 적용됨
+try:
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    UVLOOP_ENABLED = True
+except ImportError:
+    UVLOOP_ENABLED = False
+
+# VAD 게이팅: 말하는 구간(+hangover)만 STT로 보냄
+VAD_HANGOVER_SECONDS = 0.3  # 발화 종료 후에도 STT로 계속 보내는 시간
+VAD_PREROLL_FRAMES = 50     # START_OF_SPEECH 이전 프레임 보관 개수 (10ms 프레임 기준 약 0.5초)
+# 사용자 오디오 수신 포맷: Silero VAD 모델의 입력 포맷(16kHz mono)과 맞춰서 VAD 쪽 리샘플링을 생략
+USER_AUDIO_SAMPLE_RATE = 16000
+USER_AUDIO_CHANNELS = 1
+# 중간 인식 결과가 이 시간 동안 바뀌지 않으면 최종 결과 전에 미리 LLM 호출 시작
+SPECULATION_STABLE_SECONDS = 0.15
+
+# 이벤트별 잔소리 쿨다운 (없으면 AgentMemory 기본값)
+ALERT_COOLDOWNS = {
+    VisionEvents.ABSENT: 60,        # 자리비움: 처음에만 잔소리하고, 긴 시간동안 조용히 함
+    VisionEvents.USER_RETURNED: 5,  # 복귀: 짧은 쿨다운
+}
+# 쿨다운만으로 처리 여부가 결정되는 이벤트 (쿨다운 중이면 수신 즉시 버려도 되는 것들)
+# 시스템 이벤트와 WINDOW_CHANGE(대기 태스크 취소 등 부수 효과 있음)는 제외
+COOLDOWN_ONLY_EVENTS = {
+    VisionEvents.SLEEPING, VisionEvents.ABSENT, VisionEvents.USER_RETURNED,
+    VisionEvents.GAZE_AWAY, VisionEvents.PHONE_DETECTED,
+    ScreenEvents.GAMING, ScreenEvents.DISTRACTING_APP,
+}
+
+def _normalize_transcript(text: str) -> str:
+    """중간/최종 인식 결과 비교용 정규화 (대소문자, 구두점, 공백 차이 무시)"""
+    return "".join(ch for ch in text.lower() if ch.isalnum())
+
 async def entrypoint(ctx: JobContext):
     await ctx.connect()
     print("🤖 에이전트가 방에 입장했습니다.")
+    # job 프로세스에서 실제로 uvloop이 쓰이는지 확인용
+    logger.info(f"🔁 Event loop: {type(asyncio.get_running_loop()).__module__}")
     
     # 1. 모듈 초기화
     memory = AgentMemory(cooldown_seconds=10.0)
     llm_handler = LLMHandler()
+    response_cache = AgentResponseCache(ttl_seconds=300.0)
     
     # 2. TTS 초기화
     # 환경변수에서 키를 찾고, 없으면 경고
@@ -35,27 +80,136 @@ async def entrypoint(ctx: JobContext):
         logger.warning("⚠️ ELEVENLABS_API_KEY not found. TTS might fail.")
         
     tts_plugin = elevenlabs.TTS(api_key=tts_api_key)
+    current_voice_id = None  # None이면 플러그인 기본 목소리
+    tts_cache = CachedTTS()
 
     # 3. STT & VAD 초기화
-    stt_plugin = openai.STT()
+    stt_plugin = openai.STT()  # Whisper: 최종 결과(FINAL_TRANSCRIPT)만 제공, 중간 결과 없음
     vad_plugin = silero.VAD.load()
 
-    # 4. Audio Track 변수 (첫 오디오 데이터 수신 시 초기화)
-    audio_source = None
-    audio_track = None
+    # 4. Audio Track (접속 직후 TTS 출력 포맷으로 한 번만 생성/게시)
+    # 목소리를 바꿔도 TTS 인코딩은 기본값 그대로이므로 샘플레이트가 유지됨
+    audio_source = rtc.AudioSource(tts_plugin.sample_rate, tts_plugin.num_channels)
+    audio_track = rtc.LocalAudioTrack.create_audio_track("agent-voice", audio_source)
+    await ctx.room.local_participant.publish_track(audio_track)
+    logger.info(f"🔊 AudioSource 초기화: {tts_plugin.sample_rate}Hz, {tts_plugin.num_channels}ch")
     
     # 5. 현재 성격 (기본값)
     current_persona = "Strict Devil Instructor"
+    # 성격이 바뀔 때만 다시 포맷 (매 발화/잔소리마다 format 하지 않도록 캐싱)
+    formatted_system_prompt = SYSTEM_PROMPT.format(persona=current_persona)
     
     # 6. Screen Monitoring State
     # (최신 screen packet, neutral_check_task)
     last_screen_packet = None
     neutral_check_task = None
 
+    async def speak_stream(text_stream, frames_out: Optional[list] = None) -> str:
+        """
+        LLM 텍스트 스트림을 TTS 스트림에 바로 흘려보내고, 첫 오디오 청크부터 송출합니다.
+        (LLM 전체 생성 -> TTS 전체 합성을 직렬로 기다리지 않음)
+        문장 단위 분할은 ElevenLabs 플러그인의 토크나이저가 처리합니다.
+        :param frames_out: 주어지면 송출한(합쳐진) 오디오 프레임을 여기에 모음 (응답 캐시용)
+        :return: 생성된 전체 텍스트 (로그/기억용)
+        """
+        tts_stream = tts_plugin.stream()
+        parts = []
+
+        async def _feed_text():
+            try:
+                async for piece in text_stream:
+                    parts.append(piece)
+                    tts_stream.push_text(piece)
+            finally:
+                # 실패/취소되어도 입력 종료를 알려야 아래 오디오 루프가 끝남
+                try:
+                    tts_stream.end_input()
+                except Exception:
+                    pass
+
+        feed_task = asyncio.create_task(_feed_text())
+        try:
+            # 작은 TTS 청크를 모아 큰 프레임으로 송출 (capture_frame await 횟수 감소)
+            async with BatchedAudioPusher(audio_source, frames_out=frames_out) as pusher:
+                async for audio in tts_stream:
+                    await pusher.push(audio.frame)
+            await feed_task
+        finally:
+            if not feed_task.done():
+                feed_task.cancel()
+            await tts_stream.aclose()
+
+        return "".join(parts)
+
+    async def speak_text(text: str):
+        """
+        완성된 텍스트를 TTS로 송출.
+        반복되는 고정 대사(LLM 실패 시 기본 대사)만 디스크 캐시를 거치고 (같은 목소리면 ElevenLabs 호출 생략),
+        LLM이 만든 일회성 문장은 저장하지 않고 바로 합성합니다.
+        """
+        if text == FALLBACK_LINE:
+            await tts_cache.speak(
+                tts_plugin, text, audio_source,
+                voice_id=current_voice_id, model_id=getattr(tts_plugin, "model", None)
+            )
+            return
+
+        async def _single():
+            yield text
+
+        await speak_stream(_single())
+
+    async def speak_cached(cache_key: str, system_prompt: str, context_str: str,
+                           text_task: Optional[asyncio.Task] = None) -> str:
+        """
+        응답 캐시 히트 시 저장된 오디오를 재생하고, 미스 시 LLM+TTS 결과를 캐시에 저장합니다.
+        :param text_task: 이미 생성 중인 답변(추측 실행 결과)이 있으면 LLM을 다시 부르지 않고 이 결과를 사용
+        """
+        cached = response_cache.get(cache_key)
+        if cached is not None:
+            if text_task is not None:
+                text_task.cancel()
+            text, frames = cached
+            logger.info("♻️ Response Cache Hit (LLM/TTS 생략)")
+            # 저장된 프레임은 이미 100ms 단위로 합쳐져 있으므로 그대로 송출
+            for frame in frames:
+                await audio_source.capture_frame(frame)
+            return text
+
+        if text_task is not None:
+            async def _one():
+                yield await text_task
+            text_stream = _one()
+        else:
+            text_stream = llm_handler.stream_scolding(system_prompt, context_str)
+
+        # 첫 조각을 먼저 받아봄: LLM 실패 시에는 기본 대사 하나만 오므로 디스크 캐시 경로로 송출
+        # (TTS는 어차피 첫 텍스트가 와야 시작하므로 추가 지연 없음)
+        first = await anext(text_stream, None)
+        if first is None:
+            return ""
+        if first == FALLBACK_LINE:
+            await text_stream.aclose()
+            await speak_text(FALLBACK_LINE)
+            return FALLBACK_LINE
+
+        async def _rest():
+            yield first
+            async for piece in text_stream:
+                yield piece
+
+        frames = []
+        text = await speak_stream(_rest(), frames)
+        response_cache.put(cache_key, text, frames)
+        return text
+
     async def handle_user_speech(track: rtc.Track):
         """사용자 오디오 트랙 처리 (STT -> LLM -> TTS)"""
         logger.info(f"🎤 Started listening to user track: {track.sid}")
-        audio_stream = rtc.AudioStream(track)
+        # 리샘플링은 LiveKit 네이티브(Rust) 쪽에서 한 번만 수행되고, 이후 프레임 버퍼도 48kHz 대비 1/3 크기
+        audio_stream = rtc.AudioStream(
+            track, sample_rate=USER_AUDIO_SAMPLE_RATE, num_channels=USER_AUDIO_CHANNELS
+        )
         
         # STT 스트림 생성
         stt_stream = stt_plugin.stream()
@@ -63,45 +217,79 @@ async def entrypoint(ctx: JobContext):
         # VAD 스트림 생성 (음성 활동 감지용)
         vad_stream = vad_plugin.stream()
 
-        async def _read_stt_results():
-            nonlocal audio_source, audio_track, current_persona
-            async for event in stt_stream:
-                if event.type == stt.SpeechEventType.FINAL_TRANSCRIPT:
-                    text = event.alternatives[0].text
-                    if not text or len(text.strip()) < 2: continue
-                    
-                    logger.info(f"🗣️ User Said: {text}")
-                    
-                    # 🗣️ 사용자 핑계에 대한 LLM 처리
-                    # SYSTEM_PROMPT의 {persona} 부분을 현재 성격으로 치환
-                    formatted_system_prompt = SYSTEM_PROMPT.format(persona=current_persona)
-                    
-                    context_str = f"""
+        def _excuse_context(text: str) -> str:
+            # 🗣️ 사용자 핑계에 대한 LLM 입력
+            # 고정 지시문 -> 기억 요약(새 이벤트 전까지 불변) -> 실시간 발화 순서로 배치 (프롬프트 prefix 캐싱)
+            return f"""
                     [NEW INTERACTION]
                     - User is talking back/making an excuse.
-                    - User Said: "{text}"
+                    Determine if the user's excuse is valid. If not, scold them harder.
                     
                     [Current Memory]
                     {memory.get_summary()}
                     
-                    Determine if the user's excuse is valid. If not, scold them harder.
+                    [Now: {time.strftime("%H:%M:%S")}]
+                    - User Said: "{text}"
                     """
+
+        async def _speculate(text: str) -> str:
+            # 중간 결과가 안정될 때까지 기다렸다가 (그 사이 바뀌면 cancel 됨) 미리 답변 생성
+            await asyncio.sleep(SPECULATION_STABLE_SECONDS)
+            return await llm_handler.get_scolding(formatted_system_prompt, _excuse_context(text))
+
+        # 추측 실행 중인 LLM 태스크와 그 기준 텍스트 (정규화됨)
+        spec_task: Optional[asyncio.Task] = None
+        spec_key = ""
+
+        def _cancel_speculation():
+            nonlocal spec_task, spec_key
+            if spec_task and not spec_task.done():
+                spec_task.cancel()
+            spec_task = None
+            spec_key = ""
+
+        async def _read_stt_results():
+            nonlocal spec_task, spec_key
+            async for event in stt_stream:
+                if event.type == stt.SpeechEventType.INTERIM_TRANSCRIPT:
+                    # STT 최종 확정(endpoint 검출)을 기다리는 동안 LLM 호출을 겹쳐서 시작
+                    # 주의: 현재 설정된 openai.STT (Whisper)는 INTERIM_TRANSCRIPT를 보내지 않으므로
+                    # 이 분기(추측 실행)는 중간 결과를 주는 STT(Deepgram 등)로 바꿨을 때만 동작함
+                    text = event.alternatives[0].text
+                    key = _normalize_transcript(text)
+                    if len(key) < 2 or key == spec_key:
+                        continue
+                    _cancel_speculation()
+                    spec_key = key
+                    spec_task = asyncio.create_task(_speculate(text))
+
+                elif event.type == stt.SpeechEventType.FINAL_TRANSCRIPT:
+                    text = event.alternatives[0].text
+                    if not text or len(text.strip()) < 2:
+                        _cancel_speculation()
+                        continue
+                    
+                    logger.info(f"🗣️ User Said: {text}")
+
+                    # 최종 결과와 같은 내용으로 미리 생성 중이던 답변이 있으면 그대로 사용
+                    speculative = None
+                    if spec_task and spec_key == _normalize_transcript(text):
+                        speculative = spec_task
+                        spec_task = None
+                        spec_key = ""
+                    else:
+                        _cancel_speculation()
                     
                     try:
-                        reply = await llm_handler.get_scolding(formatted_system_prompt, context_str)
-                        logger.info(f"🤖 Reply to Excuse: {reply}")
-                        
-                        # TTS 송출 (scold_user 로직 재사용 가능하면 함수로 분리하는게 좋지만 일단 인라인)
-                        stream = tts_plugin.synthesize(reply)
-                        async for chunk in stream:
-                            frame = chunk.frame
-                            if audio_source is None:
-                                logger.info(f"🔊 AudioSource 초기화 (Reply): {frame.sample_rate}Hz")
-                                audio_source = rtc.AudioSource(frame.sample_rate, frame.num_channels)
-                                audio_track = rtc.LocalAudioTrack.create_audio_track("agent-voice", audio_source)
-                                await ctx.room.local_participant.publish_track(audio_track)
-                            
-                            await audio_source.capture_frame(frame)
+                        cache_key = AgentResponseCache.make_key(
+                            current_persona, "USER_EXCUSE", text.strip(), memory.digest()
+                        )
+                        # LLM 스트림 -> TTS 스트림 파이프라이닝 (같은 상황의 같은 핑계면 캐시 재생)
+                        # 미리 생성한 답변이 있으면 같은 경로로 송출하고 응답 캐시에 저장
+                        reply = await speak_cached(
+                            cache_key, formatted_system_prompt, _excuse_context(text), text_task=speculative
+                        )
+                        logger.info(f"🤖 Reply to Excuse{' (speculative)' if speculative else ''}: {reply}")
                             
                     except Exception as e:
                         logger.error(f"Reply Error: {e}")
@@ -109,16 +297,57 @@ async def entrypoint(ctx: JobContext):
         # STT 결과 수신 태스크 시작
         asyncio.create_task(_read_stt_results())
 
+        # VAD 결과로 STT 입력을 게이팅 (무음 구간은 STT API로 보내지 않음)
+        # Silero 추론 자체는 플러그인이 executor 스레드에서 수행하므로 이벤트 루프를 막지 않음
+        is_speaking = False
+        speech_end_time = 0.0
+
+        async def _read_vad_events():
+            nonlocal is_speaking, speech_end_time
+            async for vad_event in vad_stream:
+                if vad_event.type == vad.VADEventType.START_OF_SPEECH:
+                    is_speaking = True
+                elif vad_event.type == vad.VADEventType.END_OF_SPEECH:
+                    is_speaking = False
+                    speech_end_time = time.monotonic()
+
+        asyncio.create_task(_read_vad_events())
+
+        # 초당 ~100회 도는 루프이므로 메서드 조회를 루프 밖으로 뺌
+        # push_frame은 동기 함수(내부 채널에 넣기만 함)라 gather 등으로 병렬화할 대상이 아니며,
+        # 같은 AudioFrame 객체를 복사 없이 두 스트림에 공유함
+        push_stt = stt_stream.push_frame
+        push_vad = vad_stream.push_frame
+
+        # START_OF_SPEECH는 말이 시작되고 조금 뒤에 오므로, 직전 프레임을 보관했다가 같이 보냄
+        preroll = deque(maxlen=VAD_PREROLL_FRAMES)
+        stt_active = False
+
         try:
             async for event in audio_stream:
-                 # VAD 및 STT에 오디오 프레임 전달
-                 stt_stream.push_frame(event.frame)
-                 vad_stream.push_frame(event.frame)
+                 frame = event.frame
+                 push_vad(frame)
+
+                 if is_speaking or time.monotonic() - speech_end_time < VAD_HANGOVER_SECONDS:
+                     # 말하는 중 (또는 hangover) -> STT로 전달
+                     if preroll:
+                         for buffered in preroll:
+                             push_stt(buffered)
+                         preroll.clear()
+                     push_stt(frame)
+                     stt_active = True
+                 else:
+                     if stt_active:
+                         # 발화 구간 종료 -> 현재 세그먼트 인식 마무리
+                         stt_stream.flush()
+                         stt_active = False
+                     preroll.append(frame)
         except Exception as e:
             logger.error(f"Audio Stream Error: {e}")
         finally:
             stt_stream.flush()
             stt_stream.end_input()
+            vad_stream.end_input()
 
     @ctx.room.on("track_subscribed")
     def on_track_subscribed(track: rtc.Track, publication: rtc.TrackPublication, participant: rtc.RemoteParticipant):
@@ -127,48 +356,32 @@ async def entrypoint(ctx: JobContext):
             asyncio.create_task(handle_user_speech(track))
 
     async def scold_user(packet: Packet):
-        nonlocal audio_source, audio_track, current_persona
         logger.info(f"⚡ 처형 프로세스 시작: {packet.event}")
 
-        # A. 문맥 생성 (프롬프트에 페르소나 주입)
-        # SYSTEM_PROMPT의 {persona} 부분을 현재 성격으로 치환
-        formatted_system_prompt = SYSTEM_PROMPT.format(persona=current_persona)
-
+        # A. 문맥 생성 (페르소나는 캐싱된 formatted_system_prompt에 이미 주입됨)
+        # system_instruction은 매 호출 동일하게 유지하고, 기억 요약(새 이벤트 전까지 불변)을
+        # 실시간 상황보다 앞에 둬서 캐싱 가능한 prefix를 최대화
         context_str = f"""
-        [현재 상황]
-        - 이벤트: {packet.event}
-        - 상세: {packet.data}
-        
         [기억 요약]
         {memory.get_summary()}
+        
+        [현재 상황] ({time.strftime("%H:%M:%S")})
+        - 이벤트: {packet.event}
+        - 상세: {packet.data}
         """
 
-        # B. LLM 멘트 생성
+        # B. LLM 멘트 생성 + C. TTS 송출 (첫 문장이 생성되는 대로 바로 재생)
+        # 같은 성격/이벤트/반복 단계에 대한 결과가 캐시에 있으면 그대로 재생
+        # (호출 전에 add_event가 불리므로 타임스탬프가 들어간 digest()는 매번 달라져 쓸 수 없음)
         try:
-            text = await llm_handler.get_scolding(formatted_system_prompt, context_str)
+            cache_key = AgentResponseCache.make_key(
+                current_persona, packet.event, packet.data, f"repeat{memory.repeat_level(packet.event)}"
+            )
+            text = await speak_cached(cache_key, formatted_system_prompt, context_str)
             persona_name = current_persona.split('\n')[0]
             logger.info(f"🗣️ 생성된 잔소리 ({persona_name}): {text}")
         except Exception as e:
-            logger.error(f"LLM Error: {e}")
-            return
-
-        # C. TTS 송출
-        try:
-            stream = tts_plugin.synthesize(text)
-            
-            async for chunk in stream:
-                frame = chunk.frame
-                if audio_source is None:
-                    # 첫 오디오 프레임에 맞춰 소스 생성
-                    logger.info(f"🔊 AudioSource 초기화: {frame.sample_rate}Hz, {frame.num_channels}ch")
-                    audio_source = rtc.AudioSource(frame.sample_rate, frame.num_channels)
-                    audio_track = rtc.LocalAudioTrack.create_audio_track("agent-voice", audio_source)
-                    await ctx.room.local_participant.publish_track(audio_track)
-
-                await audio_source.capture_frame(frame)
-                 
-        except Exception as e:
-            logger.error(f"TTS Error: {e}")
+            logger.error(f"Scolding Error: {e}")
 
     async def check_neutral_window_later(packet: Packet):
         """중립적인 창이면 5초 대기 후 여전히 보고 있으면 LLM에게 꼰지름"""
@@ -239,7 +452,7 @@ async def entrypoint(ctx: JobContext):
 
     async def process_packet(packet):
         """실제 패킷 처리 로직 (비동기)"""
-        nonlocal current_persona, neutral_check_task, tts_plugin, audio_source, audio_track
+        nonlocal current_persona, formatted_system_prompt, neutral_check_task, tts_plugin, current_voice_id
 
         try:
             # 0. 성격 변경 이벤트 처리
@@ -256,6 +469,7 @@ async def entrypoint(ctx: JobContext):
                         current_persona = f"{p_name}\n(Character Description: {p_desc})"
                     else:
                         current_persona = p_name
+                    formatted_system_prompt = SYSTEM_PROMPT.format(persona=current_persona)
                         
                     logger.info(f"🎭 성격 변경됨: {p_name}")
                 
@@ -265,6 +479,9 @@ async def entrypoint(ctx: JobContext):
                     try:
                         # ElevenLabs TTS 플러그인 재설정 (voice_id 문자열 직접 전달)
                         tts_plugin = elevenlabs.TTS(api_key=tts_api_key, voice_id=p_voice_id)
+                        current_voice_id = p_voice_id
+                        # 캐시된 오디오는 이전 목소리이므로 폐기
+                        response_cache.clear()
                         logger.info(f"🗣️ TTS Voice Updated to: {p_voice_id}")
                     except Exception as e:
                         logger.error(f"❌ Failed to update voice: {e}")
@@ -316,19 +533,12 @@ async def entrypoint(ctx: JobContext):
                 )
                 
                 # LiveKit DataChannel로 전송 (문자열 -> 바이트)
-                await ctx.room.local_participant.publish_data(summary_packet.to_json().encode('utf-8'))
+                await ctx.room.local_participant.publish_data(summary_packet.to_bytes())
                 logger.info("📤 Session Summary Sent to Client")
 
                 # 4. 리뷰 TTS 송출 (마지막 잔소리)
                 try:
-                    stream = tts_plugin.synthesize(review_text)
-                    async for chunk in stream:
-                        frame = chunk.frame
-                        if audio_source is None:
-                            audio_source = rtc.AudioSource(frame.sample_rate, frame.num_channels)
-                            audio_track = rtc.LocalAudioTrack.create_audio_track("agent-voice", audio_source)
-                            await ctx.room.local_participant.publish_track(audio_track)
-                        await audio_source.capture_frame(frame)
+                    await speak_text(review_text)
                     logger.info("🔊 Session Review TTS Finished")
                 except Exception as e:
                     logger.error(f"Review TTS Error: {e}")
@@ -397,14 +607,14 @@ async def entrypoint(ctx: JobContext):
             # Special Handling for Vision Events (Cooldowns)
             if packet.event == VisionEvents.ABSENT:
                  # 자리비움: 처음에만 잔소리하고, 긴 시간동안 조용히 함
-                 if memory.should_alert(packet.event, cooldown_seconds=60): # 1분 쿨다운
+                 if memory.should_alert(packet.event, cooldown_seconds=ALERT_COOLDOWNS[packet.event]): # 1분 쿨다운
                       memory.add_event(packet.event, packet.data)
                       asyncio.create_task(scold_user(packet))
                  return
 
             if packet.event == VisionEvents.USER_RETURNED:
                  # 복귀: 딴짓하다 왔냐고 갈굼 (짧은 쿨다운)
-                 if memory.should_alert(packet.event, cooldown_seconds=5):
+                 if memory.should_alert(packet.event, cooldown_seconds=ALERT_COOLDOWNS[packet.event]):
                       memory.add_event(packet.event, packet.data)
                       asyncio.create_task(scold_user(packet))
                  return
@@ -436,27 +646,35 @@ async def entrypoint(ctx: JobContext):
             else:
                 payload = data_packet
 
-            # 2. 바이트 디코딩
-            if isinstance(payload, bytes):
-                decoded_str = payload.decode('utf-8')
-            else:
-                decoded_str = str(payload)
+            # 2. 바이트로 통일 (디코더가 UTF-8 bytes를 직접 파싱하므로 str 변환 불필요)
+            if not isinstance(payload, bytes):
+                payload = str(payload).encode('utf-8')
                 
         except Exception as e:
             logger.error(f"❌ 데이터 디코딩 실패: {e}")
             return
 
-        # 3. 패킷 파싱
-        try:
-            packet = Packet.from_json(decoded_str)
-            logger.info(f"📨 Packet Received: {packet.event}") # 수신 로그 강화
-        except Exception as e:
-            logger.error(f"❌ JSON 파싱 실패: {e} / Raw: {decoded_str}")
-            return
+        # 3. 패킷 파싱 (클라이언트가 여러 패킷을 줄바꿈으로 묶어 보낼 수 있음)
+        for line in payload.split(b"\n"):
+            if not line:
+                continue
+            try:
+                # 쿨다운 중인 감지 이벤트는 event 필드만 보고 바로 버림 (전체 파싱/로그/태스크 생성 생략)
+                event = Packet.peek_event(line)
+                if event in COOLDOWN_ONLY_EVENTS and memory.in_cooldown(event, ALERT_COOLDOWNS.get(event)):
+                    continue
+
+                packet = Packet.from_json(line)
+                logger.info(f"📨 Packet Received: {packet.event}") # 수신 로그 강화
+            except Exception as e:
+                logger.error(f"❌ JSON 파싱 실패: {e} / Raw: {line}")
+                continue
 
-        # 비동기 처리 로직은 별도 태스크로 실행
-        asyncio.create_task(process_packet(packet))
+            # 비동기 처리 로직은 별도 태스크로 실행
+            asyncio.create_task(process_packet(packet))
 
 if __name__ == "__main__":
     logging.basicConfig(level=logging.INFO)
+    if UVLOOP_ENABLED:
+        logger.info("⚡ uvloop event loop enabled")
     cli.run_app(WorkerOptions(entrypoint_fnc=entrypoint))
\ No newline at end of file
@@ -1,4 +1,5 @@
 # agent/memory.py
+import hashlib
 import time
 from collections import deque
 from dataclasses import dataclass
@@ -20,6 +21,8 @@ class AgentMemory:
         self.last_alert_time: Dict[str, float] = {}
         self.violation_counts: Dict[str, int] = {}
         self.cooldown_seconds = cooldown_seconds
+        # get_summary() 결과 캐시 (add_event/clear 시 무효화)
+        self._summary_cache: Optional[str] = None
 
     def add_event(self, event_type: str, data: dict):
         """이벤트를 기억에 저장하고 카운트를 증가시킵니다."""
@@ -28,6 +31,7 @@ class AgentMemory:
         # 실제 호출 여부는 main.py에서 should_alert가 true일 때만 이 함수를 호출하도록 변경할 것입니다.
         
         self.history.append(EventLog(time.time(), event_type, data))
+        self._summary_cache = None
         
         if event_type not in self.violation_counts:
             self.violation_counts[event_type] = 0
@@ -52,28 +56,55 @@ class AgentMemory:
         
         return False
 
+    def in_cooldown(self, event_type: str, cooldown_seconds: float = None) -> bool:
+        """
+        해당 이벤트가 아직 쿨다운 중인지 확인합니다. (should_alert와 달리 상태를 바꾸지 않음)
+        :param cooldown_seconds: 선택적 쿨다운 시간 오버라이드. 없으면 기본값 사용.
+        """
+        effective_cooldown = cooldown_seconds if cooldown_seconds is not None else self.cooldown_seconds
+        return time.time() - self.last_alert_time.get(event_type, 0) <= effective_cooldown
+
     def clear(self):
         """기억을 모두 초기화합니다 (새 세션 시작 시)."""
         self.history.clear()
         self.last_alert_time.clear()
         self.violation_counts.clear()
+        self._summary_cache = None
 
     def get_summary(self) -> str:
-        """LLM 프롬프트에 주입할 최근 상태 요약본을 만듭니다."""
+        """
+        LLM 프롬프트에 주입할 최근 상태 요약본을 만듭니다.
+        새 이벤트가 추가되기 전까지는 동일한 문자열을 반환하므로 프롬프트 캐싱 대상이 됩니다.
+        """
+        if self._summary_cache is None:
+            self._summary_cache = self._build_summary()
+        return self._summary_cache
+
+    def repeat_level(self, event_type: str) -> int:
+        """
+        해당 이벤트의 누적 횟수를 거칠게 나눈 단계 (0: 처음, 1: 2~3회, 2: 4회 이상).
+        타임스탬프가 없어 반복 상황에서 값이 같으므로 잔소리 응답 캐시 키로 사용합니다.
+        """
+        count = self.violation_counts.get(event_type, 0)
+        if count <= 1:
+            return 0
+        return 1 if count <= 3 else 2
+
+    def digest(self) -> str:
+        """현재 기억 상태의 해시 (응답 캐시 키용). get_summary()와 마찬가지로 새 이벤트 전까지 동일합니다."""
+        return hashlib.sha1(self.get_summary().encode("utf-8")).hexdigest()
+
+    def _build_summary(self) -> str:
         if not self.history:
             return "아직 기록된 활동이 없습니다."
 
         summary_lines = ["최근 사용자 행동 기록 (최신순):"]
         
         # 최근 이벤트들을 역순으로 (최신이 먼저 오게)
-        # 시간 차이(초)를 같이 표시해서 LLM이 시간 관계를 파악하기 쉽게 함
-        now = time.time()
+        # "N초 전" 같은 상대 시간은 매 호출마다 바뀌어 캐싱을 깨므로 발생 시각(절대 시간)을 표시함
+        # 현재 시각은 호출부의 실시간 문맥에 포함됨
         for log in reversed(self.history):
-            time_diff = int(now - log.timestamp)
-            if time_diff < 60:
-                time_str = f"{time_diff}초 전"
-            else:
-                time_str = f"{time_diff // 60}분 전"
+            time_str = time.strftime("%H:%M:%S", time.localtime(log.timestamp))
             summary_lines.append(f"- [{time_str}] {log.event_type} (Context: {log.data})")
 
         summary_lines.append("\n누적 위반 횟수:")
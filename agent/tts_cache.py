@@ -0,0 +1,120 @@
+# agent/tts_cache.py
+import asyncio
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Optional, Tuple
+
+from livekit import rtc
+
+from agent.audio_out import BatchedAudioPusher
+
+logger = logging.getLogger("procrastihator")
+
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "procrastihator" / "tts"
+
+
+class CachedTTS:
+    """
+    고정 문장(실패 시 기본 대사 등)의 TTS 결과(PCM)를 디스크에 캐싱합니다.
+    LLM이 매번 새로 만드는 문장은 반복되지 않으므로 여기로 보내지 마세요.
+    - 키: blake2b(text + voice_id + model_id)
+    - 저장: {key}.pcm (int16 PCM) + {key}.json (sample_rate, num_channels)
+    - 히트 시 ElevenLabs를 호출하지 않고 파일을 프레임으로 잘라 바로 송출
+      (첫 프레임 20ms, 이후 100ms - BatchedAudioPusher와 같은 크기)
+    - 디스크 I/O는 모두 asyncio.to_thread로 실행 (이벤트 루프를 막지 않음)
+    - 캐시 폴더를 만들 수 없으면 (읽기 전용 HOME 등) 캐시 없이 합성만 함
+    """
+
+    FIRST_FRAME_MS = 20
+    FRAME_MS = 100
+
+    def __init__(self, cache_dir: Path = DEFAULT_CACHE_DIR, max_entries: int = 256):
+        """
+        :param cache_dir: 캐시 저장 폴더
+        :param max_entries: 최대 저장 개수 (초과 시 가장 오래 안 쓰인 파일부터 삭제)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_entries = max_entries
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self.enabled = True
+        except OSError as e:
+            logger.warning(f"⚠️ TTS Cache Disabled (cannot create {self.cache_dir}): {e}")
+            self.enabled = False
+
+    @staticmethod
+    def make_key(text: str, voice_id: Optional[str], model_id: Optional[str]) -> str:
+        raw = f"{text}|{voice_id or ''}|{model_id or ''}"
+        return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+
+    async def speak(self, tts_plugin, text: str, audio_source: rtc.AudioSource,
+                    voice_id: Optional[str] = None, model_id: Optional[str] = None):
+        """text를 audio_source로 송출 (캐시 히트 시 재생, 미스 시 합성하면서 저장)"""
+        key = self.make_key(text, voice_id, model_id)
+        pcm_path = self.cache_dir / f"{key}.pcm"
+        meta_path = self.cache_dir / f"{key}.json"
+
+        if self.enabled:
+            try:
+                cached = await asyncio.to_thread(self._load, pcm_path, meta_path)
+                if cached is not None:
+                    await self._replay(*cached, audio_source)
+                    return
+            except Exception as e:
+                logger.warning(f"⚠️ TTS Cache Replay Failed (re-synthesizing): {e}")
+
+        pcm = bytearray()
+        sample_rate = num_channels = None
+        async with BatchedAudioPusher(audio_source) as pusher:
+            async for chunk in tts_plugin.synthesize(text):
+                frame = chunk.frame
+                if self.enabled:
+                    pcm += memoryview(frame.data).cast("B")
+                sample_rate, num_channels = frame.sample_rate, frame.num_channels
+                await pusher.push(frame)
+
+        if pcm and sample_rate:
+            try:
+                await asyncio.to_thread(self._store, pcm_path, meta_path, bytes(pcm), sample_rate, num_channels)
+            except OSError as e:
+                logger.warning(f"⚠️ TTS Cache Write Failed: {e}")
+
+    def _load(self, pcm_path: Path, meta_path: Path) -> Optional[Tuple[bytes, int, int]]:
+        """(pcm, sample_rate, num_channels) 반환. 캐시에 없으면 None (워커 스레드에서 실행)"""
+        if not (pcm_path.exists() and meta_path.exists()):
+            return None
+        meta = json.loads(meta_path.read_text())
+        pcm = pcm_path.read_bytes()
+        os.utime(pcm_path)  # LRU 갱신
+        return pcm, meta["sample_rate"], meta["num_channels"]
+
+    async def _replay(self, pcm: bytes, sample_rate: int, num_channels: int, audio_source: rtc.AudioSource):
+        def frame_bytes(ms: int) -> int:
+            return sample_rate * ms // 1000 * num_channels * 2  # int16
+
+        view = memoryview(pcm)
+        offset = 0
+        size = frame_bytes(self.FIRST_FRAME_MS)
+        while offset < len(view):
+            data = view[offset:offset + size]
+            frame = rtc.AudioFrame(data, sample_rate, num_channels, len(data) // (2 * num_channels))
+            await audio_source.capture_frame(frame)
+            offset += size
+            size = frame_bytes(self.FRAME_MS)
+
+    def _store(self, pcm_path: Path, meta_path: Path, pcm: bytes, sample_rate: int, num_channels: int):
+        # 워커 스레드에서 실행. 임시 파일에 쓰고 교체 (쓰다 만 파일이 재생되지 않도록). sidecar를 마지막에 써서 완료 표시
+        tmp_path = pcm_path.with_suffix(".tmp")
+        tmp_path.write_bytes(pcm)
+        os.replace(tmp_path, pcm_path)
+        meta_path.write_text(json.dumps({"sample_rate": sample_rate, "num_channels": num_channels}))
+        self._evict()
+
+    def _evict(self):
+        entries = sorted(self.cache_dir.glob("*.pcm"), key=lambda p: p.stat().st_mtime)
+        for old in entries[:max(0, len(entries) - self.max_entries)]:
+            old.unlink(missing_ok=True)
+            old.with_suffix(".json").unlink(missing_ok=True)
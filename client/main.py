@@ -169,6 +169,8 @@ def main():
     
     # (2) VisionWorker 프레임 -> DebugWindow (화면 표시)
     vision_worker.debug_frame_signal.connect(debug_window.update_image)
+    # 표시가 끝난 디버그 버퍼를 워커에 반환 (반드시 update_image 다음에 연결)
+    vision_worker.debug_frame_signal.connect(vision_worker.release_debug_frame)
 
     # (3) LiveKit 상태 -> 로그 출력
     livekit_client.connected_signal.connect(lambda: print("✅ LiveKit Connected!"))
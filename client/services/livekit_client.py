@@ -8,6 +8,13 @@ from typing import Optional
 from livekit import rtc, api
 from PyQt6.QtCore import QObject, pyqtSignal, QThread
 
+# uvloop (Windows 미지원 -> 없으면 기본 asyncio 루프 사용)
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
 # shared 폴더 import를 위한 경로 추가
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 from shared.protocol import Packet
@@ -22,7 +29,7 @@ class LiveKitWorker(QThread):
         self._ready_event = asyncio.Event() # For internal sync if needed, but we use sleep in main thread
 
     def run(self):
-        self.loop = asyncio.new_event_loop()
+        self.loop = uvloop.new_event_loop() if UVLOOP_AVAILABLE else asyncio.new_event_loop()
         asyncio.set_event_loop(self.loop)
         # 루프 무한 실행
         self.loop.run_forever()
@@ -35,6 +42,9 @@ class LiveKitClient(QObject):
     disconnected_signal = pyqtSignal()
     error_signal = pyqtSignal(str)
     packet_received_signal = pyqtSignal(object) # 수신 패킷을 UI로 전달
+
+    # 한 번의 publish_data로 묶어 보낼 최대 크기 (패킷은 줄바꿈으로 구분)
+    MAX_BATCH_BYTES = 4096
     
     def __init__(self):
         super().__init__()
@@ -50,6 +60,9 @@ class LiveKitClient(QObject):
         self._is_mic_muted = True
         self._pending_personality_packet: Optional[Packet] = None
         self._pending_session_start_packet: Optional[Packet] = None
+        # 전송 큐 (워커 루프의 단일 writer 태스크가 모아서 전송)
+        self._tx_queue: Optional[asyncio.Queue] = None
+        self._tx_task: Optional[asyncio.Task] = None
 
         # 영속적인 백그라운드 워커 스레드 시작
         self._worker = LiveKitWorker()
@@ -103,12 +116,10 @@ class LiveKitClient(QObject):
             def on_data_received(data_packet, participant=None, kind=None, topic=None):
                 try:
                     payload = data_packet.data if hasattr(data_packet, 'data') else data_packet
-                    if isinstance(payload, bytes):
-                        decoded_str = payload.decode('utf-8')
-                    else:
-                        decoded_str = str(payload)
+                    if not isinstance(payload, bytes):
+                        payload = str(payload)
                     
-                    packet = Packet.from_json(decoded_str)
+                    packet = Packet.from_json(payload)
                     print(f"📨 Packet Received from Agent: {packet.event}")
                     
                     # 시그널 발생 (메인 스레드에서 처리되도록 QMetaObject 사용 고려 필요하나,
@@ -154,6 +165,7 @@ class LiveKitClient(QObject):
             
             print("✅ Connection established!")
             self._connected = True
+            self._ensure_writer()
             
             # 마이크 트랙 초기화 및 게시 (Muted 상태로 시작)
             await self._init_microphone()
@@ -161,14 +173,17 @@ class LiveKitClient(QObject):
             self.connected_signal.emit()
 
             # 연결 직후 대기 중인 상태(성격 등)가 있다면 전송
+            # (직접 보내지 않고 전송 큐에 넣어 감지 패킷과 같은 writer가 순서대로 보내게 함)
             if self._pending_session_start_packet:
                 print("🚀 Sending Buffered Session Start")
-                await self._send_packet_async(self._pending_session_start_packet)
+                packet = self._pending_session_start_packet
+                self._tx_queue.put_nowait((packet.to_bytes(), packet.event))
                 self._pending_session_start_packet = None # 1회성 이벤트이므로 삭제
 
             if self._pending_personality_packet:
                 print(f"🚀 Sending Buffered Personality: {self._pending_personality_packet.data.get('personality')}")
-                await self._send_packet_async(self._pending_personality_packet)
+                packet = self._pending_personality_packet
+                self._tx_queue.put_nowait((packet.to_bytes(), packet.event))
             
         except Exception as e:
             print(f"❌ Connection Failed: {e}")
@@ -328,11 +343,7 @@ class LiveKitClient(QObject):
         if not paused and self._connected:
             if self._pending_personality_packet:
                 print(f"🚀 Sending Buffered Personality (On Resume): {self._pending_personality_packet.data.get('personality')}")
-                if self._worker.loop and self._worker.loop.is_running():
-                    asyncio.run_coroutine_threadsafe(
-                        self._send_packet_async(self._pending_personality_packet),
-                        self._worker.loop
-                    )
+                self._enqueue_threadsafe(self._pending_personality_packet)
                 # 전송 후 clear? 아니면 계속 유지? 
                 # (일반적으로 clear가 맞지만, 재연결 시 또 쓰일 수 있음. 일단 유지 or clear. 여기선 clear 하지 않음)
 
@@ -385,25 +396,54 @@ class LiveKitClient(QObject):
                 pass
             return
         
-        # 워커 루프에 패킷 전송 태스크 제출
-        if self._worker.loop and self._worker.loop.is_running():
-            asyncio.run_coroutine_threadsafe(
-                self._send_packet_async(packet),
-                self._worker.loop
+        self._enqueue_threadsafe(packet)
+
+    def _enqueue_threadsafe(self, packet: Packet):
+        """
+        다른 스레드(UI/워커)에서 워커 루프의 전송 큐에 넣기 (코루틴 스케줄링 없이 put만 예약)
+        모든 전송은 _writer_loop 하나가 담당하므로 패킷 순서가 보장됨
+        직렬화는 호출 스레드에서 미리 해서 asyncio 루프에는 전송만 맡김
+        """
+        if self._worker.loop and self._worker.loop.is_running() and self._tx_queue:
+            self._worker.loop.call_soon_threadsafe(
+                self._tx_queue.put_nowait, (packet.to_bytes(), packet.event)
             )
         else:
             print("⚠️ Packet dropped (Worker Loop Not Running)")
+
+    def _ensure_writer(self):
+        """전송 큐와 writer 태스크 생성 (워커 루프에서 호출, 재연결 시 중복 생성 방지)"""
+        if self._tx_queue is None:
+            self._tx_queue = asyncio.Queue()
+        if self._tx_task is None or self._tx_task.done():
+            self._tx_task = asyncio.create_task(self._writer_loop())
+
+    async def _writer_loop(self):
+        """큐에 쌓인 패킷을 한 번의 publish_data로 묶어서 전송 (줄바꿈 구분)"""
+        while True:
+            data, event = await self._tx_queue.get()
+            batch = [data]
+            events = [event]
+            size = len(data)
+
+            # 지금 당장 큐에 있는 것만 추가로 묶음 (추가 대기 없음)
+            while not self._tx_queue.empty() and size < self.MAX_BATCH_BYTES:
+                data, event = self._tx_queue.get_nowait()
+                batch.append(data)
+                events.append(event)
+                size += len(data) + 1
+
+            await self._send_packet_async(b"\n".join(batch), ", ".join(events))
     
-    async def _send_packet_async(self, packet: Packet):
-        """비동기 패킷 전송"""
+    async def _send_packet_async(self, data: bytes, event: str):
+        """비동기 패킷 전송 (data: 직렬화된 패킷, event: 로그용 이벤트 이름)"""
         if not self.room or not self.room.local_participant: 
             print("⚠️ Packet dropped (Async: No local participant)")
             return
         try:
-            data = packet.to_json().encode('utf-8')
             await self.room.local_participant.publish_data(
                 data, topic="detection", reliable=True
             )
-            print(f"📤 Packet Sent: {packet.event}")
+            print(f"📤 Packet Sent: {event}")
         except Exception as e:
             print(f"Error sending packet: {e}")
@@ -1,7 +1,7 @@
 # client/services/vision.py
 import sys
 import os
-from PyQt6.QtCore import QThread, pyqtSignal
+from PyQt6.QtCore import QThread, pyqtSignal, QSemaphore
 import cv2
 import mediapipe as mp
 from mediapipe.tasks import python
@@ -20,6 +20,8 @@ class VisionWorker(QThread):
     # 메인 UI로 보낼 신호 정의
     alert_signal = pyqtSignal(object) # Packet 객체를 보냄
     debug_frame_signal = pyqtSignal(np.ndarray) # 디버그 이미지(OpenCV 포맷) 보냄
+    # 주의: debug_frame_signal로 보낸 버퍼는 재사용되므로, 수신 측 처리 후 release_debug_frame을 호출해야 함
+    DEBUG_BUFFER_COUNT = 2
 
     def __init__(self, show_debug_window=False):
         super().__init__()
@@ -97,6 +99,13 @@ class VisionWorker(QThread):
         # 휴대폰 감지 임계값
         self.PHONE_SCORE_THRESHOLD = 0.4  # 휴대폰 감지 최소 신뢰도
         
+        # 웹캠 캡처 설정 (드라이버가 직접 프레임 속도를 맞추도록 요청)
+        self.CAPTURE_FPS = 30
+        self.CAPTURE_WIDTH = 640   # MediaPipe 얼굴/휴대폰 감지에 충분한 해상도
+        self.CAPTURE_HEIGHT = 480
+        self.CAPTURE_FOURCC = "MJPG"  # 압축 포맷으로 USB 대역폭 절감 (YUY2 대비)
+        self.CAPTURE_BUFFER_SIZE = 1  # 처리 지연 시 오래된 프레임이 쌓이지 않도록 최신 프레임만 유지
+        
         # 얼굴 방향 계산용 추가 랜드마크
         self.LEFT_EYE_INNER = 133
         self.LEFT_EYE_OUTER = 33
@@ -128,6 +137,12 @@ class VisionWorker(QThread):
         self.is_in_absent_mode = False
         self.absent_start_time = 0.0
 
+        # 디버그 프레임 버퍼 풀 (매 프레임 frame.copy() 할당 대신 미리 할당한 버퍼를 번갈아 사용)
+        # UI가 아직 쓰고 있는 버퍼를 덮어쓰지 않도록 세마포어로 사용 가능한 버퍼 수를 관리
+        self._debug_buffers = []
+        self._debug_buffer_index = 0
+        self._debug_slots = QSemaphore(self.DEBUG_BUFFER_COUNT)
+
     def calculate_ear(self, landmarks, eye_indices):
         """Eye Aspect Ratio (EAR) 계산"""
         # MediaPipe 0.10.x는 landmarks가 리스트 형태
@@ -491,6 +506,23 @@ class VisionWorker(QThread):
         self.running = False
         self.wait()
 
+    def _acquire_debug_buffer(self, frame):
+        """비어 있는 디버그 버퍼를 가져와 frame을 복사. UI가 밀려 있으면 None (프레임 드롭)"""
+        if not self._debug_slots.tryAcquire():
+            return None
+        
+        if not self._debug_buffers or self._debug_buffers[0].shape != frame.shape:
+            self._debug_buffers = [np.empty_like(frame) for _ in range(self.DEBUG_BUFFER_COUNT)]
+        
+        buf = self._debug_buffers[self._debug_buffer_index]
+        self._debug_buffer_index = (self._debug_buffer_index + 1) % self.DEBUG_BUFFER_COUNT
+        np.copyto(buf, frame)
+        return buf
+
+    def release_debug_frame(self, *_):
+        """UI가 디버그 프레임 처리를 마쳤음을 알림 (debug_frame_signal 수신 슬롯 뒤에 연결)"""
+        self._debug_slots.release()
+
     def run(self):
         self.running = True
         cap = cv2.VideoCapture(0)
@@ -499,12 +531,23 @@ class VisionWorker(QThread):
             self.running = False
             return
         
+        # 포맷/해상도/프레임 속도/버퍼는 캡처 백엔드(V4L2/DSHOW/MSMF)에서 제어 (지원하지 않는 장치는 무시함)
+        # FOURCC는 해상도보다 먼저 설정해야 일부 드라이버에서 적용됨
+        cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*self.CAPTURE_FOURCC))
+        cap.set(cv2.CAP_PROP_FRAME_WIDTH, self.CAPTURE_WIDTH)
+        cap.set(cv2.CAP_PROP_FRAME_HEIGHT, self.CAPTURE_HEIGHT)
+        cap.set(cv2.CAP_PROP_FPS, self.CAPTURE_FPS)
+        cap.set(cv2.CAP_PROP_BUFFERSIZE, self.CAPTURE_BUFFER_SIZE)
+        
         print("[OK] 웹캠 연결 성공 - Vision Worker 시작")
         
+        frame = None
         try:
             while self.running:
                 try:
-                    ret, frame = cap.read()
+                    # 이전 프레임 버퍼에 그대로 디코딩 (매 프레임 새 배열 할당 방지)
+                    # frame은 이 스레드 밖으로 나가지 않으므로 재사용해도 안전함
+                    ret, frame = cap.read(frame)
                     if not ret:
                         print("[WARNING] 프레임을 읽을 수 없습니다")
                         continue
@@ -677,20 +720,26 @@ class VisionWorker(QThread):
                             self.alert_signal.emit(packet)
                     
                     # 디버그 창 표시 (얼굴이 있든 없든 항상 표시)
-                    if self.show_debug_window:
-                        # 얼굴 랜드마크 추출
-                        face_landmarks_for_draw = None
-                        if detection_result.face_landmarks:
-                            face_landmarks_for_draw = detection_result.face_landmarks[0]
-                        
-                        debug_frame = self.draw_debug_info(
-                            frame.copy(), 
-                            face_landmarks_for_draw,
-                            avg_ear, pitch, yaw, is_sleeping, is_absent, is_gaze_away,
-                            is_phone_detected, object_result
-                        )
-                        # OpenCV 창 대신 시그널 전송
-                        self.debug_frame_signal.emit(debug_frame)
+                    debug_buffer = self._acquire_debug_buffer(frame) if self.show_debug_window else None
+                    if debug_buffer is not None:
+                        try:
+                            # 얼굴 랜드마크 추출
+                            face_landmarks_for_draw = None
+                            if detection_result.face_landmarks:
+                                face_landmarks_for_draw = detection_result.face_landmarks[0]
+                            
+                            debug_frame = self.draw_debug_info(
+                                debug_buffer, 
+                                face_landmarks_for_draw,
+                                avg_ear, pitch, yaw, is_sleeping, is_absent, is_gaze_away,
+                                is_phone_detected, object_result
+                            )
+                            # OpenCV 창 대신 시그널 전송 (이후 버퍼 반환은 수신 측 담당)
+                            self.debug_frame_signal.emit(debug_frame)
+                        except Exception:
+                            # 보내지 못한 버퍼는 여기서 반환 (안 하면 슬롯이 영구히 줄어 디버그 창이 멈춤)
+                            self.release_debug_frame()
+                            raise
                     
                     # time.sleep(0.05) # 0.1초 대기 (10 FPS)
                 
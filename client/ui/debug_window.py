@@ -3,11 +3,38 @@
 VisionWorker로부터 받은 OpenCV 이미지를 표시합니다.
 """
 
-import cv2
 import numpy as np
 from PyQt6.QtWidgets import QMainWindow, QLabel, QVBoxLayout, QWidget, QSizePolicy
-from PyQt6.QtGui import QImage, QPixmap
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtGui import QImage, QPainter
+from PyQt6.QtCore import Qt, QRect, QPoint
+
+class _VideoLabel(QLabel):
+    """
+    프레임 QImage를 paintEvent에서 직접 그리는 라벨.
+    QPixmap.fromImage + scaled 로 매 프레임 픽셀을 복사하지 않고 그릴 때 바로 스케일링.
+    """
+    def __init__(self):
+        super().__init__()
+        self._image = None
+
+    def set_image(self, image: QImage):
+        if self._image is None:
+            self.setText("")  # 대기 문구 제거
+        self._image = image
+        self.update()
+
+    def paintEvent(self, event):
+        # 배경(스타일시트)과 텍스트는 QLabel이 그림
+        super().paintEvent(event)
+        if self._image is None:
+            return
+
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+        # 라벨 크기에 맞춰 비율 유지 + 가운데 정렬
+        target = QRect(QPoint(0, 0), self._image.size().scaled(self.size(), Qt.AspectRatioMode.KeepAspectRatio))
+        target.moveCenter(self.rect().center())
+        painter.drawImage(target, self._image)
 
 class DebugWindow(QMainWindow):
     """
@@ -29,7 +56,7 @@ class DebugWindow(QMainWindow):
         layout.setContentsMargins(0, 0, 0, 0)
         
         # 비디오 표시용 라벨
-        self.video_label = QLabel()
+        self.video_label = _VideoLabel()
         self.video_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.video_label.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
         # 기본 텍스트
@@ -38,6 +65,10 @@ class DebugWindow(QMainWindow):
         
         layout.addWidget(self.video_label)
 
+        # 재사용 프레임 버퍼와 이 버퍼를 그대로 참조하는 QImage (프레임 크기가 바뀔 때만 재생성)
+        self._frame_buf = None
+        self._qimg = None
+
     def update_image(self, frame_cv):
         """
         VisionWorker로부터 받은 OpenCV 이미지(numpy array)를 화면에 표시
@@ -46,21 +77,16 @@ class DebugWindow(QMainWindow):
             return
         
         try:
-            # OpenCV 이미지를 QImage로 변환
-            # OpenCV는 BGR, PyQt는 RGB 사용하므로 변환 필요
-            rgb_image = cv2.cvtColor(frame_cv, cv2.COLOR_BGR2RGB)
-            h, w, ch = rgb_image.shape
-            bytes_per_line = ch * w
-            qt_image = QImage(rgb_image.data, w, h, bytes_per_line, QImage.Format.Format_RGB888)
-            
-            # 라벨 크기에 맞춰 스케일링
-            scaled_pixmap = QPixmap.fromImage(qt_image).scaled(
-                self.video_label.size(), 
-                Qt.AspectRatioMode.KeepAspectRatio, 
-                Qt.TransformationMode.SmoothTransformation
-            )
+            # 첫 프레임(또는 해상도 변경 시)에만 버퍼와 QImage 생성
+            # Format_BGR888은 BGR 순서를 그대로 읽으므로 cvtColor(프레임 전체 복사)가 필요 없음
+            if self._frame_buf is None or self._frame_buf.shape != frame_cv.shape:
+                h, w, ch = frame_cv.shape
+                self._frame_buf = np.empty((h, w, ch), dtype=np.uint8)
+                self._qimg = QImage(self._frame_buf.data, w, h, ch * w, QImage.Format.Format_BGR888)
             
-            self.video_label.setPixmap(scaled_pixmap)
+            # 연속 메모리 복사 1회. 이후 워커 버퍼는 바로 반환해도 안전함
+            np.copyto(self._frame_buf, frame_cv)
+            self.video_label.set_image(self._qimg)
         except Exception as e:
             print(f"Debug Image Update Error: {e}")
 
@@ -1,3 +1,4 @@
+import functools
 import sys
 import os
 from PyQt6.QtWidgets import (QApplication, QWidget, QLabel, QGridLayout, 
@@ -25,14 +26,36 @@ if project_root not in sys.path:
 from shared.constants import SystemEvents, PacketCategory
 from shared.protocol import Packet, PacketMeta
 
-# shared 폴더 import (성격 변경 패킷 전송을 위해)
-current_dir = os.path.dirname(os.path.abspath(__file__))
-project_root = os.path.dirname(os.path.dirname(os.path.dirname(current_dir)))
-if project_root not in sys.path:
-    sys.path.append(project_root)
-
-from shared.constants import SystemEvents, PacketCategory
-from shared.protocol import Packet, PacketMeta
+# 카드 스타일시트 (모든 카드가 같은 문자열 객체를 공유 -> 카드마다 새로 만들지 않음)
+_CARD_ICON_STYLE = "font-size: 32px; background: transparent;"
+_CARD_TITLE_STYLE = "font-size: 16px; font-weight: bold; color: #E0E0E0; margin-top: 10px; background: transparent;"
+
+# 선택되었을 때: 붉은색 테두리 + 약간 붉은 틴트 배경
+_CARD_SELECTED_QSS = """
+    {name} {{
+        background-color: #2A1A1C; 
+        border: 2px solid #D64550;
+        border-radius: 15px;
+    }}
+"""
+# 기본 상태: 어두운 회색 배경 + 연한 테두리
+_CARD_DEFAULT_QSS = """
+    {name} {{
+        background-color: #1A1B1E;
+        border: 2px solid #333333;
+        border-radius: 15px;
+    }}
+    {name}:hover {{
+        border: 2px solid #555555;
+        background-color: #252629;
+    }}
+"""
+
+@functools.lru_cache(maxsize=None)
+def _card_style(card_class_name, selected):
+    """카드 종류/선택 상태별 스타일시트 (조합마다 한 번만 생성)"""
+    template = _CARD_SELECTED_QSS if selected else _CARD_DEFAULT_QSS
+    return template.format(name=card_class_name)
 
 class ListPanelWidget(QWidget):
     """리스트 패널 위젯 - 녹색 테두리 박스"""
@@ -81,13 +104,13 @@ class BaseCard(QFrame):
         # 아이콘
         self.lbl_icon = QLabel(self.icon)
         self.lbl_icon.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.lbl_icon.setStyleSheet("font-size: 32px; background: transparent;")
+        self.lbl_icon.setStyleSheet(_CARD_ICON_STYLE)
         
         # 제목
         self.lbl_title = QLabel(self.title)
         self.lbl_title.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.lbl_title.setWordWrap(True)
-        self.lbl_title.setStyleSheet("font-size: 16px; font-weight: bold; color: #E0E0E0; margin-top: 10px; background: transparent;")
+        self.lbl_title.setStyleSheet(_CARD_TITLE_STYLE)
 
         layout.addWidget(self.lbl_icon)
         layout.addWidget(self.lbl_title)
@@ -115,28 +138,7 @@ class BaseCard(QFrame):
 
     def update_style(self):
         """스타일 업데이트 - 공통 스타일 로직"""
-        if self.is_selected:
-            # 선택되었을 때: 붉은색 테두리 + 약간 붉은 틴트 배경
-            self.setStyleSheet(f"""
-                {self.card_class_name} {{
-                    background-color: #2A1A1C; 
-                    border: 2px solid #D64550;
-                    border-radius: 15px;
-                }}
-            """)
-        else:
-            # 기본 상태: 어두운 회색 배경 + 연한 테두리
-            self.setStyleSheet(f"""
-                {self.card_class_name} {{
-                    background-color: #1A1B1E;
-                    border: 2px solid #333333;
-                    border-radius: 15px;
-                }}
-                {self.card_class_name}:hover {{
-                    border: 2px solid #555555;
-                    background-color: #252629;
-                }}
-            """)
+        self.setStyleSheet(_card_style(self.card_class_name, self.is_selected))
 
 class PersonalityCard(BaseCard):
     """성격 선택 카드"""
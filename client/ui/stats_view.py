@@ -1,8 +1,9 @@
+import functools
 import os
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QColor, QPainter, QPen, QPixmap
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, Qt, pyqtSignal
+from PyQt6.QtGui import QColor, QImage, QPainter, QPen, QPixmap
 from PyQt6.QtWidgets import (
     QWidget,
     QLabel,
@@ -14,27 +15,39 @@ from PyQt6.QtWidgets import (
 from shared.constants import VisionEvents
 import client.ui.name as name
 
+try:
+    from client.ui.floating_widget import FloatingWidget
+
+    _PERSONALITY_MAP: Dict[str, str] = FloatingWidget.PERSONALITY_IMAGE_MAP
+except Exception:
+    _PERSONALITY_MAP = {}
+
 
 def _format_duration_hhmmss(seconds: float) -> str:
-    try:
-        total = max(0, int(seconds))
-    except Exception:
-        total = 0
-    h = total // 3600
-    m = (total % 3600) // 60
-    s = total % 60
+    if isinstance(seconds, (int, float)):
+        # Fast path: the summary always carries a number.
+        total = int(seconds) if 0 < seconds < float("inf") else 0
+    else:
+        try:
+            total = max(0, int(seconds))
+        except Exception:
+            total = 0
+    return _format_total_seconds(total)
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_total_seconds(total: int) -> str:
+    m, s = divmod(total, 60)
+    h, m = divmod(m, 60)
     return f"{h:02d}:{m:02d}:{s:02d}"
 
 
+@functools.lru_cache(maxsize=None)
 def _personality_to_image_filename(personality: str) -> str:
-    # Prefer the same mapping used by FloatingWidget.
-    try:
-        from client.ui.floating_widget import FloatingWidget
-
-        if personality in FloatingWidget.PERSONALITY_IMAGE_MAP:
-            return FloatingWidget.PERSONALITY_IMAGE_MAP[personality]
-    except Exception:
-        pass
+    # Prefer the same mapping used by FloatingWidget (resolved once at import).
+    filename = _PERSONALITY_MAP.get(personality)
+    if filename is not None:
+        return filename
 
     # Fallback: scan personality_cards
     for icon, title, _desc in getattr(name, "personality_cards", []):
@@ -44,22 +57,112 @@ def _personality_to_image_filename(personality: str) -> str:
     return "test.png"
 
 
+# One stylesheet for both panels; labels pick their rule via objectName
+# (parsed once per panel instead of once per label).
+_PANEL_QSS = """
+* { background-color: #000000; }
+
+QLabel#statsHeader {
+    font-family: 'Courier New'; font-size: 22px; font-weight: bold; color: #00FF41; letter-spacing: 2px;
+}
+QLabel#totalViolations {
+    font-family: 'Courier New'; font-size: 96px; font-weight: bold; color: #00FF41;
+}
+QLabel#totalViolations[violations="true"] { color: #FF3333; }
+QLabel#totalSub { font-family: 'JetBrains Mono'; font-size: 14px; color: #00AA22; }
+QLabel#totalSub[violations="true"] { color: #CC2222; }
+QLabel#durationValue { font-family: 'JetBrains Mono'; font-size: 28px; font-weight: bold; color: #00FF41; }
+QLabel#durationSub { font-family: 'JetBrains Mono'; font-size: 12px; color: #00AA22; }
+QLabel#divider { background-color: #005511; }
+QLabel#detailName { font-family: 'JetBrains Mono'; font-size: 14px; color: #00FF41; }
+QLabel#detailValue { font-family: 'JetBrains Mono'; font-size: 16px; font-weight: bold; color: #00FF41; }
+
+QLabel#personalityImage { background: transparent; }
+QLabel#feedbackText {
+    font-family: 'JetBrains Mono', monospace; font-size: 16px; color: #00FF41; background: transparent;
+}
+"""
+
+
+_ASSETS_DIR = os.path.join(os.path.dirname(__file__), "assets")
+
+
+@functools.lru_cache(maxsize=64)
+def _resolve_asset_path(filename: str) -> str:
+    image_path = os.path.join(_ASSETS_DIR, filename)
+    if not os.path.exists(image_path):
+        image_path = os.path.join(_ASSETS_DIR, "test.png")
+    return image_path
+
+
+class _PixmapLoaderSignals(QObject):
+    loaded = pyqtSignal(object, QImage)
+
+
+class PixmapLoader(QRunnable):
+    """
+    Loads and scales an image on a QThreadPool thread.
+    Works on QImage (QPixmap may only be used on the GUI thread) and emits
+    signals.loaded(tag, image); a null image means the file could not be read.
+    The signals object is owned by the caller so it outlives the runnable.
+    """
+
+    def __init__(self, path: str, size: int, signals: _PixmapLoaderSignals, tag: Any = None):
+        super().__init__()
+        self.path = path
+        self.size = size
+        self.tag = tag
+        self.signals = signals
+
+    def run(self):
+        image = QImage(self.path)
+        if not image.isNull():
+            # Assets authored close to the target size don't benefit from a bilinear pass.
+            factor = self.size / max(1, image.width(), image.height())
+            if 0.85 <= factor <= 1.15:
+                mode = Qt.TransformationMode.FastTransformation
+            else:
+                mode = Qt.TransformationMode.SmoothTransformation
+
+            image = image.scaled(
+                self.size,
+                self.size,
+                Qt.AspectRatioMode.KeepAspectRatio,
+                mode,
+            )
+        try:
+            self.signals.loaded.emit(self.tag, image)
+        except RuntimeError:
+            # The owning widget (and its signals object) was destroyed while loading.
+            pass
+
+
 class _GreenBorderPanel(QWidget):
     """Black panel with 10px inset green border (Pip-Boy style)."""
 
+    # Created on first paint (QGuiApplication must exist), then shared by all panels.
+    _BORDER_PEN: Optional[QPen] = None
+
     def __init__(self, parent: Optional[QWidget] = None):
         super().__init__(parent)
-        self.setStyleSheet("background-color: #000000;")
+        self.setStyleSheet(_PANEL_QSS)
+        self._border_rect = self.rect().adjusted(10, 10, -10, -10)
+
+    def resizeEvent(self, event):
+        # Border geometry only changes with the size, so compute it here instead of per paint.
+        self._border_rect = self.rect().adjusted(10, 10, -10, -10)
+        super().resizeEvent(event)
 
     def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        cls = _GreenBorderPanel
+        if cls._BORDER_PEN is None:
+            cls._BORDER_PEN = QPen(QColor(0, 255, 65), 1)
 
-        rect = self.rect().adjusted(10, 10, -10, -10)
-        pen = QPen(QColor(0, 255, 65), 1)
-        painter.setPen(pen)
+        # Axis-aligned 1px rectangle: no antialiasing needed.
+        painter = QPainter(self)
+        painter.setPen(cls._BORDER_PEN)
         painter.setBrush(Qt.BrushStyle.NoBrush)
-        painter.drawRect(rect)
+        painter.drawRect(self._border_rect)
 
         super().paintEvent(event)
 
@@ -74,6 +177,8 @@ class StatsSummaryWidget(_GreenBorderPanel):
 
     def __init__(self, parent: Optional[QWidget] = None):
         super().__init__(parent)
+        # Last value pushed to each label, so unchanged values skip setText/setNum (and the relayout).
+        self._last_values: Dict[QLabel, Any] = {}
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(30, 30, 30, 30)
@@ -82,7 +187,7 @@ class StatsSummaryWidget(_GreenBorderPanel):
         # --- Header Section ---
         header = QLabel("SESSION REPORT")
         header.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        header.setStyleSheet("font-family: 'Courier New'; font-size: 22px; font-weight: bold; color: #00FF41; letter-spacing: 2px;")
+        header.setObjectName("statsHeader")
         layout.addWidget(header)
 
         layout.addSpacing(10)
@@ -90,19 +195,12 @@ class StatsSummaryWidget(_GreenBorderPanel):
         # --- Total Violations (The Impactful Part) ---
         self.lbl_total_violations = QLabel("0")
         self.lbl_total_violations.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.lbl_total_violations.setStyleSheet(
-            """
-            font-family: 'Courier New'; 
-            font-size: 96px; 
-            font-weight: bold; 
-            color: #00FF41;
-            """
-        )
+        self.lbl_total_violations.setObjectName("totalViolations")
         layout.addWidget(self.lbl_total_violations)
 
         self.lbl_total_sub = QLabel("TOTAL VIOLATIONS")
         self.lbl_total_sub.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.lbl_total_sub.setStyleSheet("font-family: 'JetBrains Mono'; font-size: 14px; color: #00AA22;")
+        self.lbl_total_sub.setObjectName("totalSub")
         layout.addWidget(self.lbl_total_sub)
 
         layout.addSpacing(30)
@@ -110,12 +208,12 @@ class StatsSummaryWidget(_GreenBorderPanel):
         # --- Session Duration ---
         self.lbl_duration_val = QLabel("00:00:00")
         self.lbl_duration_val.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.lbl_duration_val.setStyleSheet("font-family: 'JetBrains Mono'; font-size: 28px; font-weight: bold; color: #00FF41;")
+        self.lbl_duration_val.setObjectName("durationValue")
         layout.addWidget(self.lbl_duration_val)
 
         lbl_duration_sub = QLabel("SESSION DURATION")
         lbl_duration_sub.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        lbl_duration_sub.setStyleSheet("font-family: 'JetBrains Mono'; font-size: 12px; color: #00AA22;")
+        lbl_duration_sub.setObjectName("durationSub")
         layout.addWidget(lbl_duration_sub)
 
         layout.addSpacing(30)
@@ -123,7 +221,7 @@ class StatsSummaryWidget(_GreenBorderPanel):
         # --- Divider ---
         divider = QLabel()
         divider.setFixedHeight(2)
-        divider.setStyleSheet("background-color: #005511;")
+        divider.setObjectName("divider")
         layout.addWidget(divider)
         
         layout.addSpacing(20)
@@ -147,16 +245,19 @@ class StatsSummaryWidget(_GreenBorderPanel):
         for label, (event_key, value_widget) in self.detail_map.items():
             # Label
             lbl_name = QLabel(label)
-            lbl_name.setStyleSheet("font-family: 'JetBrains Mono'; font-size: 14px; color: #00FF41;")
+            lbl_name.setObjectName("detailName")
             
             # Value
-            value_widget.setStyleSheet("font-family: 'JetBrains Mono'; font-size: 16px; font-weight: bold; color: #00FF41;")
+            value_widget.setObjectName("detailValue")
             value_widget.setAlignment(Qt.AlignmentFlag.AlignRight)
 
             details_layout.addWidget(lbl_name, row, 0)
             details_layout.addWidget(value_widget, row, 1)
             row += 1
 
+        # Flattened once so set_summary doesn't walk the dict on every update
+        self._detail_rows: List[Tuple[QLabel, str]] = [(w, ek) for (ek, w) in self.detail_map.values()]
+
         layout.addWidget(details_container)
         layout.addStretch(1)
 
@@ -168,40 +269,40 @@ class StatsSummaryWidget(_GreenBorderPanel):
         total_violations = int(summary.get("total_violations", 0))
         duration = summary.get("duration_seconds", 0.0)
 
-        # Update Top Stats
-        self.lbl_total_violations.setText(str(total_violations))
-        self.lbl_duration_val.setText(_format_duration_hhmmss(duration))
-        
-        # Critical Style for High Violations
-        if total_violations > 0:
-            # Red warning color for violations
-            self.lbl_total_violations.setStyleSheet(
-                """
-                font-family: 'Courier New'; 
-                font-size: 96px; 
-                font-weight: bold; 
-                color: #FF3333;
-                text-shadow: 0 0 10px #FF0000;
-                """
-            )
-            self.lbl_total_sub.setText("VIOLATIONS DETECTED")
-            self.lbl_total_sub.setStyleSheet("font-family: 'JetBrains Mono'; font-size: 14px; color: #CC2222;")
-        else:
-            self.lbl_total_violations.setStyleSheet(
-                """
-                font-family: 'Courier New'; 
-                font-size: 96px; 
-                font-weight: bold; 
-                color: #00FF41;
-                """
-            )
-            self.lbl_total_sub.setText("PERFECT SESSION")
-            self.lbl_total_sub.setStyleSheet("font-family: 'JetBrains Mono'; font-size: 14px; color: #00AA22;")
-
-        # Update Details
-        for label, (event_key, widget) in self.detail_map.items():
-            count = counts.get(event_key, 0)
-            widget.setText(f"{count}")
+        # Repaints suspended for the whole update so all labels repaint once, together
+        self.setUpdatesEnabled(False)
+        try:
+            # Update Top Stats
+            self._set_num_if_changed(self.lbl_total_violations, total_violations)
+            self._set_if_changed(self.lbl_duration_val, _format_duration_hhmmss(duration))
+
+            # Critical Style for High Violations (red via the [violations="true"] rules)
+            has_violations = total_violations > 0
+            if self.lbl_total_sub.property("violations") != has_violations:
+                for widget in (self.lbl_total_violations, self.lbl_total_sub):
+                    widget.setProperty("violations", has_violations)
+                    widget.style().unpolish(widget)
+                    widget.style().polish(widget)
+            self._set_if_changed(self.lbl_total_sub, "VIOLATIONS DETECTED" if has_violations else "PERFECT SESSION")
+
+            # Update Details
+            counts_get = counts.get
+            for widget, event_key in self._detail_rows:
+                self._set_num_if_changed(widget, int(counts_get(event_key, 0)))
+        finally:
+            self.setUpdatesEnabled(True)
+        self.update()
+
+    def _set_if_changed(self, widget: QLabel, text: str):
+        if self._last_values.get(widget) != text:
+            self._last_values[widget] = text
+            widget.setText(text)
+
+    def _set_num_if_changed(self, widget: QLabel, value: int):
+        # setNum formats on the C++ side (no Python str round-trip)
+        if self._last_values.get(widget) != value:
+            self._last_values[widget] = value
+            widget.setNum(value)
 
 
 class StatsFeedbackWidget(_GreenBorderPanel):
@@ -211,8 +312,14 @@ class StatsFeedbackWidget(_GreenBorderPanel):
     - feedback text (English, from Gemini)
     """
 
+    # Scaled personality images, shared by all instances: (filename, target_size) -> QPixmap
+    _PIXMAP_CACHE: Dict[Tuple[str, int], QPixmap] = {}
+
     def __init__(self, parent: Optional[QWidget] = None):
         super().__init__(parent)
+        self._last_personality: Optional[str] = None
+        self._loader_signals = _PixmapLoaderSignals(self)
+        self._loader_signals.loaded.connect(self._on_image_loaded, Qt.ConnectionType.QueuedConnection)
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(24, 24, 24, 24)
@@ -220,44 +327,47 @@ class StatsFeedbackWidget(_GreenBorderPanel):
 
         self.image_label = QLabel("")
         self.image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.image_label.setStyleSheet("background: transparent;")
+        self.image_label.setObjectName("personalityImage")
         layout.addWidget(self.image_label, 2)
 
         self.feedback_label = QLabel("Generating feedback...")
         self.feedback_label.setWordWrap(True)
         self.feedback_label.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop)
-        self.feedback_label.setStyleSheet(
-            """
-            font-family: 'JetBrains Mono', monospace;
-            font-size: 16px;
-            color: #00FF41;
-            background: transparent;
-            """
-        )
+        self.feedback_label.setObjectName("feedbackText")
         layout.addWidget(self.feedback_label, 1)
 
         self.set_personality(getattr(name, "user_personality", "") or "")
 
     def set_personality(self, personality: str):
+        if personality == self._last_personality:
+            return
+        self._last_personality = personality
+
         filename = _personality_to_image_filename(personality)
-        assets_dir = os.path.join(os.path.dirname(__file__), "assets")
-        image_path = os.path.join(assets_dir, filename)
-        if not os.path.exists(image_path):
-            image_path = os.path.join(assets_dir, "test.png")
-
-        pixmap = QPixmap(image_path)
-        if pixmap.isNull():
-            self.image_label.setPixmap(QPixmap())
-            self.image_label.setText("")
+        key = (filename, 500)
+        scaled = self._PIXMAP_CACHE.get(key)
+        if scaled is not None:
+            self.image_label.setPixmap(scaled)
             return
 
-        scaled = pixmap.scaled(
-            500,
-            500,
-            Qt.AspectRatioMode.KeepAspectRatio,
-            Qt.TransformationMode.SmoothTransformation,
+        # Decode + scale off the GUI thread; the result comes back via _on_image_loaded.
+        QThreadPool.globalInstance().start(
+            PixmapLoader(_resolve_asset_path(filename), 500, self._loader_signals, (personality, key))
         )
-        self.image_label.setPixmap(scaled)
+
+    def _on_image_loaded(self, tag, image: QImage):
+        personality, key = tag
+        if image.isNull():
+            if personality == self._last_personality:
+                self.image_label.setPixmap(QPixmap())
+                self.image_label.setText("")
+            return
+
+        scaled = QPixmap.fromImage(image)
+        self._PIXMAP_CACHE[key] = scaled
+        # Ignore results for a personality that was replaced while loading.
+        if personality == self._last_personality:
+            self.image_label.setPixmap(scaled)
 
     def set_feedback_text(self, text: str):
         self.feedback_label.setText(text or "")
@@ -1,28 +1,157 @@
 """
 MediaPipe Face Landmarker 모델 다운로드 스크립트
 """
+import argparse
+import hashlib
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+import urllib.error
 import urllib.request
 
 MODEL_URL = "https://storage.googleapis.com/mediapipe-models/face_landmarker/face_landmarker/float16/1/face_landmarker.task"
 MODEL_PATH = os.path.join("client", "services", "face_landmarker.task")
+EXPECTED_SHA256 = "64184e229b263107bc2b804c6625db1341ff2bb731874b0bcc2fe6544e0bc9ff"
+
+CHUNK_SIZE = 1 << 20  # 1 MiB 단위로 읽고 씀
+MAX_RETRIES = 3
+TIMEOUT_SECONDS = 30
+PARALLEL_PARTS = 4
+
+def _sha256_of(path):
+    """파일의 SHA-256 계산 (청크 단위로 읽음)"""
+    hasher = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            hasher.update(chunk)
+    return hasher
+
+def _fetch(part_path):
+    """
+    part_path에 이어받기. 이미 받은 부분이 있으면 Range 요청으로 나머지만 받음
+    :return: 받은 파일 전체의 sha256 객체
+    """
+    offset = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+    request = urllib.request.Request(MODEL_URL)
+    if offset:
+        request.add_header("Range", f"bytes={offset}-")
+
+    with urllib.request.urlopen(request, timeout=TIMEOUT_SECONDS) as resp:
+        if offset and resp.status == 206:
+            # 이어받기: 기존 부분의 해시부터 계산
+            print(f"이어받기: {offset / (1024*1024):.2f} MB 부터")
+            hasher = _sha256_of(part_path)
+            mode = "ab"
+        else:
+            # 서버가 Range를 무시한 경우 처음부터 다시 받음
+            hasher = hashlib.sha256()
+            mode = "wb"
+
+        # 받으면서 해시도 같이 계산 (다운로드 후 파일을 다시 읽지 않음)
+        with open(part_path, mode) as f:
+            for chunk in iter(lambda: resp.read(CHUNK_SIZE), b""):
+                hasher.update(chunk)
+                f.write(chunk)
+    return hasher
+
+def _fetch_range(part_path, lo, hi):
+    """[lo, hi] 구간을 받아 파일의 같은 위치에 씀 (스레드마다 파일을 따로 열어서 seek)"""
+    request = urllib.request.Request(MODEL_URL, headers={"Range": f"bytes={lo}-{hi}"})
+    with urllib.request.urlopen(request, timeout=TIMEOUT_SECONDS) as resp:
+        if resp.status != 206:
+            raise OSError(f"Range 요청 거부됨 (HTTP {resp.status})")
+        with open(part_path, "r+b") as f:
+            f.seek(lo)
+            for chunk in iter(lambda: resp.read(CHUNK_SIZE), b""):
+                f.write(chunk)
+
+def _fetch_parallel(part_path):
+    """
+    Range 요청 PARALLEL_PARTS개로 나눠 동시에 받음
+    :return: sha256 객체. 서버가 Range를 지원하지 않으면 None (단일 스트림으로 대체)
+    """
+    head = urllib.request.Request(MODEL_URL, method="HEAD")
+    with urllib.request.urlopen(head, timeout=TIMEOUT_SECONDS) as resp:
+        size = int(resp.headers.get("Content-Length") or 0)
+        accept_ranges = resp.headers.get("Accept-Ranges", "")
+    if size < PARALLEL_PARTS or accept_ranges.lower() != "bytes":
+        print("[INFO] 서버가 Range 요청을 지원하지 않아 단일 스트림으로 받습니다")
+        return None
+
+    # 전체 크기로 미리 만들어두고 각 구간을 제자리에 씀
+    with open(part_path, "wb"):
+        pass
+    os.truncate(part_path, size)
+
+    step = size // PARALLEL_PARTS
+    ranges = [(i * step, size - 1 if i == PARALLEL_PARTS - 1 else (i + 1) * step - 1)
+              for i in range(PARALLEL_PARTS)]
+    with ThreadPoolExecutor(max_workers=PARALLEL_PARTS) as pool:
+        for future in [pool.submit(_fetch_range, part_path, lo, hi) for lo, hi in ranges]:
+            future.result()
+
+    # 구간이 순서대로 도착하지 않으므로 해시는 다 받은 뒤 한 번에 계산
+    return _sha256_of(part_path)
+
+def download_model(parallel=False):
+    """
+    Face Landmarker 모델 다운로드
+    :param parallel: True면 Range 요청으로 나눠 병렬 다운로드 (실패 시 단일 스트림)
+    """
+    # 이미 올바른 파일이 있으면 건너뜀
+    if os.path.exists(MODEL_PATH) and _sha256_of(MODEL_PATH).hexdigest() == EXPECTED_SHA256:
+        print(f"[OK] 이미 최신 모델이 있습니다 (cached): {MODEL_PATH}")
+        return True
 
-def download_model():
-    """Face Landmarker 모델 다운로드"""
     print(f"다운로드 중: {MODEL_URL}")
     print(f"저장 위치: {MODEL_PATH}")
-    
+
     os.makedirs(os.path.dirname(MODEL_PATH), exist_ok=True)
-    
-    try:
-        urllib.request.urlretrieve(MODEL_URL, MODEL_PATH)
+    part_path = MODEL_PATH + ".part"
+
+    if parallel:
+        try:
+            hasher = _fetch_parallel(part_path)
+            if hasher is not None and hasher.hexdigest() == EXPECTED_SHA256:
+                os.replace(part_path, MODEL_PATH)
+                print(f"[OK] 모델 다운로드 완료 (병렬): {MODEL_PATH}")
+                print(f"파일 크기: {os.path.getsize(MODEL_PATH) / (1024*1024):.2f} MB")
+                return True
+            if hasher is not None:
+                print("[WARN] 병렬 다운로드 해시 불일치, 단일 스트림으로 다시 받습니다")
+        except (urllib.error.URLError, OSError) as e:
+            print(f"[WARN] 병렬 다운로드 실패, 단일 스트림으로 다시 받습니다: {e}")
+        # 병렬로 받다 만 파일은 이어받기에 쓸 수 없음
+        if os.path.exists(part_path):
+            os.remove(part_path)
+
+    for attempt in range(1, MAX_RETRIES + 1):
+        try:
+            digest = _fetch(part_path).hexdigest()
+        except (urllib.error.URLError, OSError) as e:
+            print(f"[WARN] 다운로드 실패 ({attempt}/{MAX_RETRIES}): {e}")
+            if isinstance(e, urllib.error.HTTPError) and e.code == 416 and os.path.exists(part_path):
+                # 받아둔 부분이 잘못됨 (Range 범위 밖) -> 처음부터 다시
+                os.remove(part_path)
+            if attempt < MAX_RETRIES:
+                time.sleep(2 ** attempt)  # 2, 4초 대기 후 이어받기
+            continue
+
+        if digest != EXPECTED_SHA256:
+            print(f"[ERROR] 해시 불일치: {digest}")
+            os.remove(part_path)
+            return False
+
+        os.replace(part_path, MODEL_PATH)
         print(f"[OK] 모델 다운로드 완료: {MODEL_PATH}")
         print(f"파일 크기: {os.path.getsize(MODEL_PATH) / (1024*1024):.2f} MB")
-    except Exception as e:
-        print(f"[ERROR] 다운로드 실패: {e}")
-        return False
-    
-    return True
+        return True
+
+    print("[ERROR] 다운로드 실패: 재시도 횟수 초과")
+    return False
 
 if __name__ == "__main__":
-    download_model()
+    parser = argparse.ArgumentParser(description="MediaPipe Face Landmarker 모델 다운로드")
+    parser.add_argument("--parallel", action="store_true", help="Range 요청 4개로 나눠 병렬 다운로드")
+    args = parser.parse_args()
+    download_model(parallel=args.parallel)
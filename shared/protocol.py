@@ -1,33 +1,47 @@
-from dataclasses import dataclass, field, asdict
 import time
-import json
 from typing import Any, Dict
 
-@dataclass
-class PacketMeta:
+import msgspec
+
+class PacketMeta(msgspec.Struct, frozen=True):
     category: str  # VISION, SCREEN, SYSTEM
-    timestamp: float = field(default_factory=time.time)
+    timestamp: float = msgspec.field(default_factory=time.time)
 
-@dataclass
-class Packet:
+class Packet(msgspec.Struct, frozen=True):
     event: str     # DROWSY, WINDOW_CHANGE...
     data: Dict[str, Any]
     meta: PacketMeta
 
+    # 전송용: 객체 -> UTF-8 JSON bytes 변환 (publish_data에 바로 전달)
+    def to_bytes(self) -> bytes:
+        return _encoder.encode(self)
+
     # 전송용: 객체 -> JSON String 변환
-    def to_json(self):
-        return json.dumps({
-            "meta": asdict(self.meta),
-            "event": self.event,
-            "data": self.data
-        })
-
-    # 수신용: JSON String -> 객체 변환
+    def to_json(self) -> str:
+        return self.to_bytes().decode('utf-8')
+
+    # 수신용: JSON (bytes 또는 str) -> 객체 변환
+    @staticmethod
+    def from_json(json_data) -> "Packet":
+        return _decoder.decode(json_data)
+
+    # 수신용: 전체 파싱 없이 event 필드만 읽기 (필터링용)
     @staticmethod
-    def from_json(json_str):
-        d = json.loads(json_str)
-        return Packet(
-            event=d['event'],
-            data=d['data'],
-            meta=PacketMeta(**d['meta'])
-        )
\ No newline at end of file
+    def peek_event(json_data) -> str:
+        return _head_decoder.decode(json_data).event
+
+
+class _PacketHead(msgspec.Struct):
+    event: str
+
+
+def _enc_hook(obj):
+    # numpy 스칼라(np.float64 등)는 파이썬 기본 타입으로 변환
+    if hasattr(obj, "item"):
+        return obj.item()
+    raise NotImplementedError(f"Cannot encode {type(obj)}")
+
+# 인코더/디코더는 매 호출마다 만들지 않고 재사용
+_encoder = msgspec.json.Encoder(enc_hook=_enc_hook)
+_decoder = msgspec.json.Decoder(Packet)
+_head_decoder = msgspec.json.Decoder(_PacketHead)
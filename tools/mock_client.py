@@ -105,7 +105,7 @@ async def main():
         meta=PacketMeta(category="VISION")
     )
     
-    payload = packet.to_json().encode('utf-8')
+    payload = packet.to_bytes()
     
     print(f"📤 Sending data: {packet.event}")
     